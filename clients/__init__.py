@@ -6,7 +6,7 @@ from typing import Optional
 
 import httpx
 
-from core.config import settings
+from core.config import get_settings
 
 from .topn_db_client import TopnDbClient
 
@@ -17,7 +17,7 @@ def get_client() -> httpx.AsyncClient:
     """Get the global async client instance."""
     global _client
     if _client is None:
-        base_url = settings.TOPN_DB_BASE_URL
+        base_url = get_settings().TOPN_DB_BASE_URL
         _client = httpx.AsyncClient(
             base_url=base_url,
             timeout=30.0,
@@ -34,4 +34,6 @@ async def close_client():
         _client = None
 
 
-topn_db_client = TopnDbClient(base_url=settings.TOPN_DB_BASE_URL, client=get_client())
+topn_db_client = TopnDbClient(
+    base_url=get_settings().TOPN_DB_BASE_URL, client=get_client()
+)
@@ -2,6 +2,7 @@ from logging import getLogger
 from typing import Any, Dict, Optional
 
 import httpx
+import orjson
 
 logger = getLogger(__name__)
 
@@ -52,9 +53,20 @@ class TopnDbClient:
 
         logger.debug(f"Making {method} request to {url}")
 
+        # Encode bodies with orjson rather than httpx's stdlib json encoder
+        content = None
+        headers = None
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+            headers = {"Content-Type": "application/json"}
+
         try:
             response = await self.client.request(
-                method=method, url=url, json=json_data, params=params
+                method=method,
+                url=url,
+                content=content,
+                headers=headers,
+                params=params,
             )
             response.raise_for_status()
 
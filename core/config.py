@@ -1,23 +1,32 @@
 """Define configuration settings using Pydantic and manage environment variables."""
 
+import os
+from functools import lru_cache
 from logging import getLogger
 from typing import Optional
 
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
-from pydantic import ValidationInfo, field_validator
+from pydantic import PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = getLogger(__name__)
 
-load_dotenv("dev.env")
+# Guard against re-parsing dev.env when the module is reloaded (e.g. in tests).
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv("dev.env")
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
 class Settings(BaseSettings):
     """Class defining configuration settings using Pydantic."""
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=True
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        # Build the validation schema on first instantiation, not at import
+        defer_build=True,
     )
 
     TOPN_DB_BASE_URL: str
@@ -29,12 +38,15 @@ class Settings(BaseSettings):
     GROQ_API_KEY: Optional[str] = None
     GROQ_MODEL_NAME: Optional[str] = None
 
-    GENERATIVE_MODEL: Optional[ChatGroq] = None
-
     CYCLE_FREQUENCY_SECONDS: int = 10
 
     DEFAULT_LAST_MINUTES_GETTING: int = 45
 
+    # How long stored item URLs of a task URL are reused between cycles
+    EXISTING_URLS_CACHE_SECONDS: int = 60
+
+    _generative_model: Optional[ChatGroq] = PrivateAttr(default=None)
+
     @field_validator("LOG_LEVEL")
     def validate_log_level(cls, value: str) -> str:
         """Validate that LOG_LEVEL is a valid logging level."""
@@ -49,19 +61,19 @@ class Settings(BaseSettings):
             return "INFO"
         return value_upper
 
-    @field_validator("GENERATIVE_MODEL")
-    def generative_model(
-        cls, value: Optional[ChatGroq], info: ValidationInfo
-    ) -> Optional[ChatGroq]:
-        env_data = info.data
-
-        model_name = env_data.get("GROQ_MODEL_NAME")
-        api_key = env_data.get("GROQ_API_KEY")
-
-        if model_name:
-            return ChatGroq(model_name=model_name, api_key=api_key)
-        else:
-            raise ValueError("GROQ_MODEL_NAME must be set")
+    @property
+    def GENERATIVE_MODEL(self) -> ChatGroq:
+        """Return the Groq chat model, constructing it on first access."""
+        if self._generative_model is None:
+            if not self.GROQ_MODEL_NAME:
+                raise ValueError("GROQ_MODEL_NAME must be set")
+            self._generative_model = ChatGroq(
+                model_name=self.GROQ_MODEL_NAME, api_key=self.GROQ_API_KEY
+            )
+        return self._generative_model
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, building it on first use."""
+    return Settings()
@@ -3,16 +3,36 @@
 This module provides a unified logging setup with:
 - Console output for real-time monitoring
 - Rotating file logs for persistence
+- Non-blocking emission: records are queued and written by a background thread
 - Structured log format with timestamps
 - Configurable log levels via environment variables
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import TimedRotatingFileHandler
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 from typing import Optional
 
+# Number of records buffered before they are written to the log file, and the
+# maximum time a low-rate record may wait in the buffer.
+FILE_BUFFER_CAPACITY = 512
+FILE_FLUSH_INTERVAL_SECONDS = 1.0
+
+_listener: Optional[QueueListener] = None
+_flusher: Optional["_PeriodicFlusher"] = None
+_CONFIGURED: set[tuple] = set()
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -46,15 +66,36 @@ def setup_logging(
 
     log_file_path = log_dir / log_filename
 
+    # Repeated calls with identical settings are no-ops, so re-imports do not
+    # reopen the log file or stack up handlers; any changed argument (e.g. a
+    # new level) reconfigures.
+    key = (
+        str(log_file_path),
+        rotation_when,
+        rotation_interval,
+        backup_count,
+        log_level,
+        console_output,
+    )
+    if key in _CONFIGURED:
+        return logging.getLogger()
+
     # Define log format
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
     # Create formatters
-    formatter = logging.Formatter(log_format, datefmt=date_format)
+    formatter = _FastFormatter(log_format, datefmt=date_format)
+
+    # The worker runs in a single process and the format uses none of the
+    # caller, thread or process fields, so skip collecting them per record.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     # Configure file handler with rotation
-    file_handler = TimedRotatingFileHandler(
+    file_handler = _BatchFileHandler(
         filename=str(log_file_path),
         when=rotation_when,
         interval=rotation_interval,
@@ -64,8 +105,16 @@ def setup_logging(
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)  # Capture all levels in file
 
+    # Coalesce file writes; errors are written through immediately
+    buffered_file_handler = _BatchFlushMemoryHandler(
+        capacity=FILE_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
     # Prepare handlers list
-    handlers = [file_handler]
+    handlers = [buffered_file_handler]
 
     # Add console handler if requested
     if console_output:
@@ -74,21 +123,28 @@ def setup_logging(
         console_handler.setLevel(log_level)  # Console respects log_level
         handlers.append(console_handler)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.DEBUG,  # Root logger captures everything
-        format=log_format,
-        datefmt=date_format,
-        handlers=handlers,
-        force=True,  # Override any existing configuration
-    )
+    # Route records through a queue: callers (including the asyncio event
+    # loop) only enqueue, while a listener thread does the actual file and
+    # console writes.
+    log_queue: queue.Queue = queue.Queue(-1)
 
-    # Get root logger
+    # Configure root logger
     root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(logging.DEBUG)  # Root logger captures everything
+
+    _start_listener(QueueListener(log_queue, *handlers, respect_handler_level=True))
+    _start_flusher(buffered_file_handler)
 
     # Suppress overly verbose third-party loggers
     _configure_third_party_loggers()
 
+    _CONFIGURED.clear()
+    _CONFIGURED.add(key)
+
     root_logger.info(
         "Logging initialized: level=%s, file=%s, rotation=%s, backups=%d",
         log_level,
@@ -100,6 +156,116 @@ def setup_logging(
     return root_logger
 
 
+@lru_cache(maxsize=1)
+def _format_second(seconds: int, datefmt: str) -> str:
+    """Render a whole-second timestamp; records within one second share it."""
+    return time.strftime(datefmt, time.localtime(seconds))
+
+
+class _FastFormatter(logging.Formatter):
+    """Formatter reusing the rendered timestamp for records in the same second."""
+
+    default_msec_format = None
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        return _format_second(int(record.created), datefmt)
+
+
+class _BatchFileHandler(TimedRotatingFileHandler):
+    """Rotating file handler able to write many records with one write call."""
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        records = [record for record in records if self.filter(record)]
+        if not records:
+            return
+        with self.lock:
+            try:
+                if self.shouldRollover(records[0]):
+                    self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(
+                    "".join(self.format(record) + self.terminator for record in records)
+                )
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[-1])
+
+
+class _BatchFlushMemoryHandler(MemoryHandler):
+    """MemoryHandler that hands its whole buffer to the target at once.
+
+    The stock implementation forwards records one by one, which costs a
+    ``write()`` + ``flush()`` per record on the file handler.
+    """
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.target is not None and self.buffer:
+                self.target.emit_batch(self.buffer)
+                self.buffer.clear()
+
+
+def flush_logging() -> None:
+    """Write out any log records still held in the file buffer."""
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.flush()
+
+
+class _PeriodicFlusher(threading.Thread):
+    """Daemon thread flushing a buffering handler at a fixed interval."""
+
+    def __init__(self, handler: logging.Handler, interval: float) -> None:
+        super().__init__(name="log-flusher", daemon=True)
+        self._handler = handler
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._handler.flush()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def _start_listener(listener: QueueListener) -> None:
+    """Start *listener*, replacing (and flushing) any previously running one."""
+    global _listener
+    _stop_listener()
+    listener.start()
+    _listener = listener
+
+
+def _start_flusher(handler: logging.Handler) -> None:
+    """Start the periodic flush of *handler*."""
+    global _flusher
+    _flusher = _PeriodicFlusher(handler, FILE_FLUSH_INTERVAL_SECONDS)
+    _flusher.start()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Drain the log queue and stop the background listener thread."""
+    global _listener, _flusher
+    if _flusher is not None:
+        _flusher.stop()
+        _flusher = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            # MemoryHandler.close() flushes but leaves its target open
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+        _listener = None
+
+
 def _configure_third_party_loggers():
     """Reduce noise from verbose third-party libraries."""
     # Set httpx to WARNING to avoid excessive connection logs
@@ -108,10 +274,21 @@ def _configure_third_party_loggers():
     # Set httpcore to WARNING
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-    # Suppress urllib3 info logs
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    # hpack and h2 log every HTTP/2 header block and frame at DEBUG, which
+    # the DEBUG root logger would otherwise queue and write to the file
+    logging.getLogger("hpack").setLevel(logging.WARNING)
+    logging.getLogger("h2").setLevel(logging.WARNING)
+
+    # urllib3 is only a transitive dependency; keep its records away from the
+    # root handlers entirely
+    urllib3_logger = logging.getLogger("urllib3")
+    urllib3_logger.setLevel(logging.WARNING)
+    urllib3_logger.propagate = False
+    if not any(isinstance(h, logging.NullHandler) for h in urllib3_logger.handlers):
+        urllib3_logger.addHandler(logging.NullHandler())
 
-    # Suppress asyncio debug logs
+    # Suppress asyncio debug logs. Warnings keep propagating so that e.g.
+    # "Task exception was never retrieved" still reaches the log file.
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 
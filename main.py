@@ -1,12 +1,15 @@
 import asyncio
 import logging
+import time
 
 from clients import close_client, topn_db_client
-from core.config import settings
-from core.logging_config import setup_logging
+from core.config import get_settings
+from core.logging_config import flush_logging, setup_logging
 from tools.monitoring.monitor import ItemMonitor
 from tools.scraping.olx import OLXScraper
 
+settings = get_settings()
+
 # Initialize logging system
 setup_logging(
     log_level=settings.LOG_LEVEL,
@@ -22,6 +25,10 @@ logger = logging.getLogger(__name__)
 
 async def worker_main():
     monitor = ItemMonitor(db_client=topn_db_client, scraper_cls=OLXScraper)
+    # Cycles start on a fixed cadence, so the time spent in run_once() is
+    # part of the period instead of being added to it.
+    next_cycle_at = time.monotonic()
+    overrun_cycles = 0
     try:
         while True:
             try:
@@ -29,10 +36,25 @@ async def worker_main():
                 await monitor.run_once()
             except Exception as e:
                 logger.error(f"Error in item finder: {e}", exc_info=True)
-            logger.info(
-                f"Sleeping for {settings.CYCLE_FREQUENCY_SECONDS} seconds before next cycle"
-            )
-            await asyncio.sleep(settings.CYCLE_FREQUENCY_SECONDS)
+
+            next_cycle_at += settings.CYCLE_FREQUENCY_SECONDS
+            now = time.monotonic()
+            delay = max(0.0, next_cycle_at - now)
+            if delay == 0:
+                # Start right away, but do not queue up missed cycles
+                next_cycle_at = now
+                overrun_cycles += 1
+                if overrun_cycles >= 2:
+                    logger.warning(
+                        f"Item search cycles take longer than "
+                        f"{settings.CYCLE_FREQUENCY_SECONDS} seconds "
+                        f"({overrun_cycles} in a row)"
+                    )
+            else:
+                overrun_cycles = 0
+
+            logger.info(f"Sleeping for {delay:.1f} seconds before next cycle")
+            await asyncio.sleep(delay)
     finally:
         logger.info("Closing ItemMonitor and scraper resources")
         await monitor.close()
@@ -45,7 +67,17 @@ async def main():
     finally:
         logger.info("Shutting down OLX item notification worker")
         await close_client()
+        flush_logging()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional (not available on Windows); fall back to asyncio's loop.
+    # A loop factory replaces uvloop.install(), which is deprecated on 3.12+.
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -60,6 +60,19 @@ class TestTopnDbClient(IsolatedAsyncioTestCase):
         data2 = await self.client._make_request("DELETE", "/y")
         self.assertEqual(data2, {"success": True})
 
+    async def test_make_request_encodes_json_body(self):
+        resp = MagicMock()
+        resp.status_code = 201
+        resp.json.return_value = {"id": 1}
+        resp.raise_for_status.return_value = None
+        self.httpx_client.request = AsyncMock(return_value=resp)
+
+        await self.client._make_request("POST", "/items", json_data={"a": "ż"})
+
+        kwargs = self.httpx_client.request.await_args.kwargs
+        self.assertEqual(kwargs["content"], '{"a":"ż"}'.encode())
+        self.assertEqual(kwargs["headers"], {"Content-Type": "application/json"})
+
     async def test_make_request_http_error_and_exception(self):
         import httpx
 
@@ -18,7 +18,7 @@ class TestSettings(IsolatedAsyncioTestCase):
         sys.modules["langchain_groq"] = types.SimpleNamespace(
             ChatGroq=type("ChatGroq", (), {"__init__": lambda *a, **k: None})
         )
-        # Ensure no GROQ_MODEL_NAME -> constructing Settings should raise
+        # Ensure no GROQ_MODEL_NAME -> accessing GENERATIVE_MODEL should raise
         os.environ.pop("GROQ_MODEL_NAME", None)
         core = importlib.import_module("core.config")
         # Disable reading from .env to simulate truly missing env var
@@ -26,8 +26,9 @@ class TestSettings(IsolatedAsyncioTestCase):
             core.Settings.model_config["env_file"] = None
         except Exception:
             pass
+        s = core.Settings()
         try:
-            _ = core.Settings()
+            _ = s.GENERATIVE_MODEL
         except Exception as e:
             self.assertIsInstance(e, ValueError)
         else:
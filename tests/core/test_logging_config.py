@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase
+
+from core import logging_config
+
+
+class TestSetupLogging(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self._tmp.name)
+
+    async def asyncTearDown(self):
+        logging_config._stop_listener()
+        logging_config._CONFIGURED.clear()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        self._tmp.cleanup()
+
+    def _setup(self, **kwargs):
+        kwargs.setdefault("log_dir", self.log_dir)
+        kwargs.setdefault("log_filename", "test.log")
+        return logging_config.setup_logging(**kwargs)
+
+    async def test_repeat_call_with_same_settings_is_noop(self):
+        self._setup(console_output=False)
+        handlers = list(logging.getLogger().handlers)
+        listener = logging_config._listener
+
+        self._setup(console_output=False)
+
+        self.assertEqual(logging.getLogger().handlers, handlers)
+        self.assertIs(logging_config._listener, listener)
+
+    async def test_repeat_call_with_new_level_reconfigures(self):
+        self._setup(log_level="INFO", console_output=True)
+        self._setup(log_level="ERROR", console_output=True)
+
+        console = [
+            h
+            for h in logging_config._listener.handlers
+            if type(h) is logging.StreamHandler
+        ]
+        self.assertEqual([h.level for h in console], [logging.ERROR])
+
+    async def test_repeat_call_can_turn_console_off(self):
+        self._setup(console_output=True)
+        self._setup(console_output=False)
+
+        self.assertFalse(
+            any(
+                type(h) is logging.StreamHandler
+                for h in logging_config._listener.handlers
+            )
+        )
+
+
+class TestBufferedFileLogging(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_file = Path(self._tmp.name) / "test.log"
+        # Keep the periodic flusher out of the way so only the behaviour
+        # under test writes the buffer out
+        self._interval = logging_config.FILE_FLUSH_INTERVAL_SECONDS
+        logging_config.FILE_FLUSH_INTERVAL_SECONDS = 3600
+        logging_config.setup_logging(
+            log_dir=Path(self._tmp.name),
+            log_filename="test.log",
+            console_output=False,
+        )
+        self.logger = logging.getLogger("tests.logging")
+
+    async def asyncTearDown(self):
+        logging_config.FILE_FLUSH_INTERVAL_SECONDS = self._interval
+        logging_config._stop_listener()
+        logging_config._CONFIGURED.clear()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        self._tmp.cleanup()
+
+    def _drain_queue(self):
+        """Wait until the listener thread has handled every queued record."""
+        logging_config._listener.queue.join()
+
+    def _file_text(self):
+        return self.log_file.read_text(encoding="utf-8")
+
+    async def test_records_are_buffered_until_flush_logging(self):
+        self.logger.info("buffered record")
+        self._drain_queue()
+        self.assertNotIn("buffered record", self._file_text())
+
+        logging_config.flush_logging()
+
+        self.assertIn("buffered record", self._file_text())
+
+    async def test_error_record_flushes_buffer_immediately(self):
+        self.logger.info("earlier info")
+        self.logger.error("something broke")
+        self._drain_queue()
+
+        text = self._file_text()
+        self.assertIn("earlier info", text)
+        self.assertIn("something broke", text)
+        # Records keep their order within the batch
+        self.assertLess(text.index("earlier info"), text.index("something broke"))
+
+    async def test_shutdown_writes_pending_records(self):
+        for i in range(3):
+            self.logger.info("pending %d", i)
+
+        # What the atexit hook runs at interpreter shutdown
+        logging_config._stop_listener()
+
+        text = self._file_text()
+        for i in range(3):
+            self.assertIn(f"pending {i}", text)
+        self.assertIsNone(logging_config._listener)
+
+    async def test_periodic_flusher_writes_buffer(self):
+        flusher = logging_config._PeriodicFlusher(
+            logging_config._listener.handlers[0], interval=0.01
+        )
+        flusher.start()
+        try:
+            self.logger.info("flushed by timer")
+            self._drain_queue()
+            for _ in range(100):
+                if "flushed by timer" in self._file_text():
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            flusher.stop()
+
+        self.assertIn("flushed by timer", self._file_text())
@@ -1,8 +1,10 @@
 import importlib
+import logging
 import os
+import tempfile
 import types
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestMain(IsolatedAsyncioTestCase):
@@ -18,8 +20,22 @@ class TestMain(IsolatedAsyncioTestCase):
             ),
         )
 
+        # main configures logging on import with log_dir=None, i.e. the
+        # current directory; keep its log file out of the repository
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+
     async def asyncTearDown(self):
-        pass
+        from core import logging_config
+
+        logging_config._stop_listener()
+        logging_config._CONFIGURED.clear()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
 
     async def test_worker_main_runs_one_cycle_and_closes(self):
         mod = importlib.import_module("main")
@@ -43,6 +59,34 @@ class TestMain(IsolatedAsyncioTestCase):
             inst.run_once.assert_awaited()
             inst.close.assert_awaited()
 
+    async def test_worker_main_sleeps_until_next_cycle_deadline(self):
+        import asyncio
+
+        mod = importlib.import_module("main")
+        importlib.reload(mod)
+
+        delays = []
+
+        async def stop(delay):
+            delays.append(delay)
+            raise asyncio.CancelledError
+
+        with patch("main.ItemMonitor") as Mon:
+            inst = Mon.return_value
+            inst.run_once = AsyncMock()
+            inst.close = AsyncMock()
+            # Cycle starts at t=100 and run_once() takes 3 seconds. Replace
+            # main's `time` module only, so the event loop keeps its clock.
+            clock = types.SimpleNamespace(
+                monotonic=MagicMock(side_effect=[100.0, 103.0])
+            )
+            with patch("main.time", new=clock):
+                with patch("main.asyncio.sleep", new=stop):
+                    with self.assertRaises(asyncio.CancelledError):
+                        await mod.worker_main()
+
+        self.assertEqual(delays, [mod.settings.CYCLE_FREQUENCY_SECONDS - 3.0])
+
     async def test_main_calls_worker_and_closes_client(self):
         mod = importlib.import_module("main")
         importlib.reload(mod)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import types
 from unittest import IsolatedAsyncioTestCase
@@ -76,18 +77,17 @@ class TestItemMonitor(IsolatedAsyncioTestCase):
         FakeScraper.Item = self.Item
 
         self.monitor = ItemMonitor(
-            db_client=self.db, scraper_cls=FakeScraper, cycle_sleep_seconds=0
+            db_client=self.db, scraper_cls=FakeScraper, min_url_interval_seconds=0
         )
 
     async def asyncTearDown(self):
         await self.monitor.close()
 
-    async def test_run_once_persists_items_and_sleeps_between(self):
-        with patch("tools.monitoring.monitor.asyncio.sleep", new=AsyncMock()) as sl:
-            await self.monitor.run_once()
+    async def test_run_once_persists_items_for_each_distinct_url(self):
+        await self.monitor.run_once()
         # Called for two distinct URLs
+        self.assertEqual(self.db.get_items_by_source_url.await_count, 2)
         self.assertGreaterEqual(self.db.create_item.await_count, 4)
-        sl.assert_awaited()
 
     async def test_persist_items_sets_source_field(self):
         # Build items with various urls
@@ -134,17 +134,153 @@ class TestItemMonitor(IsolatedAsyncioTestCase):
         )  # default fallback is OLX
         self.assertEqual([p["source_url"] for p in payloads], ["SRC", "SRC", "SRC"])
 
+    async def test_persist_items_resolves_delegated_hosts_per_item(self):
+        items = [
+            self.Item(
+                title=title,
+                price="",
+                image_url="",
+                created_at=None,
+                location="",
+                item_url=url,
+                description="",
+                created_at_pretty="",
+            )
+            for title, url in [
+                ("a", "https://www.olx.pl/d/oferta/a"),
+                ("b", "https://www.otodom.pl/pl/oferta/b"),
+            ]
+        ]
+        await self.monitor._persist_items(
+            items, source_url="https://www.olx.pl/nieruchomosci/"
+        )
+        payloads = [
+            call.args[0] if call.args else call.kwargs["item_data"]
+            for call in self.db.create_item.await_args_list
+        ]
+        self.assertEqual([p["source"] for p in payloads], ["OLX", "OTODOM"])
+
     async def test_run_once_handles_fetch_errors_and_continues(self):
         # Make get_items_by_source_url raise for first url only
         self.db.get_items_by_source_url.side_effect = [
             RuntimeError("boom"),
             {"items": []},
         ]
-        with patch("tools.monitoring.monitor.asyncio.sleep", new=AsyncMock()):
-            await self.monitor.run_once()
+        await self.monitor.run_once()
         # Should still attempt second url, so not zero persisting calls
         self.assertGreaterEqual(self.db.create_item.await_count, 1)
 
+    async def test_run_once_reuses_cached_existing_urls(self):
+        await self.monitor.run_once()
+        await self.monitor.run_once()
+        # Fetched once per distinct URL, then served from the cache
+        self.assertEqual(self.db.get_items_by_source_url.await_count, 2)
+        _, cached = self.monitor._existing_cache["https://u1"]
+        self.assertIn("https://old", cached)
+        self.assertIn("https://u1/new1", cached)
+
+    async def test_existing_urls_ttl_defaults_to_setting(self):
+        from core.config import get_settings
+
+        self.assertEqual(
+            self.monitor.existing_urls_ttl_seconds,
+            get_settings().EXISTING_URLS_CACHE_SECONDS,
+        )
+
+    async def test_run_once_refetches_existing_urls_when_ttl_is_zero(self):
+        self.monitor.existing_urls_ttl_seconds = 0
+        await self.monitor.run_once()
+        await self.monitor.run_once()
+        self.assertEqual(self.db.get_items_by_source_url.await_count, 4)
+
+    async def test_run_once_logs_errors_raised_while_persisting(self):
+        with patch(
+            "tools.monitoring.monitor._build_item_data",
+            side_effect=RuntimeError("bad item"),
+        ):
+            with self.assertLogs("tools.monitoring.monitor", level="ERROR") as logs:
+                await self.monitor.run_once()
+
+        errors = [r for r in logs.records if r.getMessage().startswith("Error")]
+        self.assertEqual(
+            sorted(r.args[0] for r in errors), ["https://u1", "https://u2"]
+        )
+        self.assertIsInstance(errors[0].exc_info[1], RuntimeError)
+
+    async def test_run_once_spaces_out_scrapes_of_the_same_host(self):
+        self.db.get_all_tasks.return_value = {
+            "tasks": [
+                {"url": "https://www.olx.pl/a"},
+                {"url": "https://www.olx.pl/b"},
+                {"url": "https://www.otodom.pl/c"},
+            ]
+        }
+        self.monitor.min_url_interval_seconds = 60
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        with patch("tools.monitoring.monitor.asyncio.sleep", new=fake_sleep):
+            await self.monitor.run_once()
+
+        # Only the second olx.pl URL waits; the other host starts right away
+        self.assertEqual(len(sleeps), 1)
+        self.assertGreater(sleeps[0], 59)
+
+    async def test_run_once_forgets_urls_dropped_from_tasks(self):
+        from tools.monitoring.monitor import _origin
+
+        self.db.get_all_tasks.return_value = {
+            "tasks": [
+                {"url": "https://www.olx.pl/a"},
+                {"url": "https://www.otodom.pl/c"},
+            ]
+        }
+        await self.monitor.run_once()
+        self.assertIn("https://www.otodom.pl/c", self.monitor._existing_cache)
+
+        # The Otodom task is deleted between cycles
+        self.db.get_all_tasks.return_value = {
+            "tasks": [{"url": "https://www.olx.pl/a"}]
+        }
+        await self.monitor.run_once()
+
+        self.assertEqual(list(self.monitor._existing_cache), ["https://www.olx.pl/a"])
+        otodom = _origin("https://www.otodom.pl/c")
+        self.assertNotIn(otodom, self.monitor._host_next_start)
+        self.assertNotIn(otodom, self.monitor._host_locks)
+        self.assertIn(_origin("https://www.olx.pl/a"), self.monitor._host_next_start)
+
+    async def test_persist_items_bounds_concurrent_creates(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create_item(payload):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        self.db.create_item = create_item
+        items = [
+            self.Item(
+                title=str(i),
+                price="",
+                image_url="",
+                created_at=None,
+                location="",
+                item_url=f"https://www.olx.pl/d/{i}",
+                description="",
+                created_at_pretty="",
+            )
+            for i in range(20)
+        ]
+        await self.monitor._persist_items(items, source_url="https://www.olx.pl/")
+
+        self.assertEqual(max_in_flight, self.monitor.MAX_CONCURRENT_PERSISTS)
+
     async def test_run_once_raises_on_outer_error(self):
         self.db.get_all_tasks.side_effect = RuntimeError("fatal")
         with self.assertRaises(RuntimeError):
@@ -152,5 +288,9 @@ class TestItemMonitor(IsolatedAsyncioTestCase):
 
     async def test_close_delegates_to_scraper(self):
         scr = self.monitor.scraper
-        await self.monitor.close()
+        with patch(
+            "tools.monitoring.monitor.close_shared_client", new=AsyncMock()
+        ) as close_shared:
+            await self.monitor.close()
         self.assertTrue(getattr(scr, "closed", False))
+        close_shared.assert_awaited_once()
@@ -16,10 +16,11 @@ class TestDescriptionSummarizer(IsolatedAsyncioTestCase):
                 ChatGroq=type("ChatGroq", (), {"__init__": lambda *a, **k: None})
             ),
         )
-        from tools.processing.description import DescriptionSummarizer, settings
+        from core.config import get_settings
+        from tools.processing.description import DescriptionSummarizer
 
         self.DescriptionSummarizer = DescriptionSummarizer
-        self.settings = settings
+        self.settings = get_settings()
 
     async def asyncTearDown(self):
         pass
@@ -27,7 +28,7 @@ class TestDescriptionSummarizer(IsolatedAsyncioTestCase):
     async def test_summarize_returns_content(self):
         s = self.DescriptionSummarizer()
         fake_resp = MagicMock(content="summary")
-        self.settings.GENERATIVE_MODEL = types.SimpleNamespace(
+        self.settings._generative_model = types.SimpleNamespace(
             ainvoke=AsyncMock(return_value=fake_resp)
         )
         res = await s.summarize("desc")
@@ -35,8 +36,25 @@ class TestDescriptionSummarizer(IsolatedAsyncioTestCase):
 
     async def test_summarize_handles_exception(self):
         s = self.DescriptionSummarizer()
-        self.settings.GENERATIVE_MODEL = types.SimpleNamespace(
+        self.settings._generative_model = types.SimpleNamespace(
             ainvoke=AsyncMock(side_effect=RuntimeError("x"))
         )
         res = await s.summarize("desc")
         self.assertEqual(res, "")
+
+    async def test_summarize_many_batches_and_keeps_order(self):
+        s = self.DescriptionSummarizer()
+        abatch = AsyncMock(return_value=[MagicMock(content="first"), RuntimeError("x")])
+        self.settings._generative_model = types.SimpleNamespace(abatch=abatch)
+
+        res = await s.summarize_many(["desc 1", "desc 2"])
+
+        self.assertEqual(res, ["first", ""])
+        abatch.assert_awaited_once()
+        prompts = abatch.await_args.args[0]
+        self.assertEqual(len(prompts), 2)
+        self.assertIn("desc 2", prompts[1])
+
+    async def test_summarize_many_empty_input(self):
+        s = self.DescriptionSummarizer()
+        self.assertEqual(await s.summarize_many([]), [])
@@ -1,3 +1,4 @@
+import asyncio
 from unittest import IsolatedAsyncioTestCase
 
 from tools.scraping.base import BaseScraper
@@ -11,6 +12,21 @@ class DummyScraper(BaseScraper):
         return "", ""
 
 
+class SlowDetailScraper(DummyScraper):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_item_details(self, item_url, summarizer):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if item_url == "bad":
+            raise RuntimeError("boom")
+        return f"desc {item_url}", f"img {item_url}"
+
+
 class TestBaseScraper(IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.scraper = DummyScraper()
@@ -21,3 +37,33 @@ class TestBaseScraper(IsolatedAsyncioTestCase):
     async def test_close_returns_none(self):
         res = await self.scraper.close()
         self.assertIsNone(res)
+
+    async def test_fetch_item_details_many_preserves_order_and_bounds_concurrency(
+        self,
+    ):
+        scraper = SlowDetailScraper()
+        urls = [f"u{i}" for i in range(10)]
+
+        details = await scraper.fetch_item_details_many(
+            urls, None, semaphore=asyncio.Semaphore(3)
+        )
+
+        self.assertEqual(details, [(f"desc {u}", f"img {u}") for u in urls])
+        self.assertEqual(scraper.max_in_flight, 3)
+
+    async def test_fetch_item_details_many_defaults_to_class_concurrency(self):
+        scraper = SlowDetailScraper()
+        scraper.DETAIL_FETCH_CONCURRENCY = 2
+
+        await scraper.fetch_item_details_many([f"u{i}" for i in range(5)], None)
+
+        self.assertEqual(scraper.max_in_flight, 2)
+
+    async def test_fetch_item_details_many_reports_failures_per_item(self):
+        scraper = SlowDetailScraper()
+
+        details = await scraper.fetch_item_details_many(["ok", "bad"], None)
+
+        self.assertEqual(details[0], ("desc ok", "img ok"))
+        self.assertIn("Failed to load description", details[1][0])
+        self.assertEqual(details[1][1], "")
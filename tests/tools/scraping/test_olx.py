@@ -3,7 +3,7 @@ import types
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from bs4 import BeautifulSoup
+import lxml.html
 
 from tools.scraping.types import ScraperType
 
@@ -52,8 +52,8 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
 
     async def test_fetch_new_items_filters_and_builds_items(self):
         # Mock httpx responses for list and details
-        list_resp = MagicMock(status_code=200, text=OLX_LISTING_HTML)
-        detail_resp = MagicMock(status_code=200, text=DETAIL_HTML)
+        list_resp = MagicMock(status_code=200, content=OLX_LISTING_HTML.encode())
+        detail_resp = MagicMock(status_code=200, content=DETAIL_HTML.encode())
 
         with patch(
             "httpx.AsyncClient.get", new=AsyncMock(side_effect=[list_resp, detail_resp])
@@ -74,6 +74,7 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
         self.assertEqual(len(items), 1)
         it = items[0]
         self.assertEqual(it.title, "Nice flat")
+        self.assertEqual(it.price, "1 500 zł")
         # Note: Summarizer is not yet implemented in OLXScraper (see TODO in fetch_item_details)
         # So we expect the raw description from the HTML
         self.assertIn("Some long description", it.description)
@@ -101,18 +102,56 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
 
     async def test_extract_helpers(self):
         scr = self.OLXScraper()
-        soup = BeautifulSoup(DETAIL_HTML, "html.parser")
-        img = scr._extract_highres_image(soup)
+        tree = lxml.html.fromstring(DETAIL_HTML)
+        img = scr._extract_highres_image(tree)
         self.assertEqual(img, "http://b.jpg")
-        desc = scr._extract_description(soup)
+        desc = scr._extract_description(tree)
         self.assertIn("Some long description", desc)
 
+    async def test_extract_description_skips_scripts_and_comments(self):
+        scr = self.OLXScraper()
+        tree = lxml.html.fromstring(
+            '<html><body><div data-cy="ad_description">A<b>B</b>'
+            "<script>var x=1</script> C<!-- note --><style>p{}</style></div>"
+            "</body></html>"
+        )
+        self.assertEqual(scr._extract_description(tree), "ABC")
+
+    async def test_fetch_item_details_handles_empty_body(self):
+        resp = MagicMock(status_code=200, content=b"  \n")
+        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=resp)):
+            scr = self.OLXScraper()
+            details = await scr.fetch_item_details("http://olx/d/oferta/1", None)
+
+        self.assertEqual(details, ("", ""))
+
+    async def test_fetch_new_items_returns_nothing_for_empty_listing_body(self):
+        resp = MagicMock(status_code=200, content=b"")
+        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=resp)):
+            scr = self.OLXScraper()
+            items = await scr.fetch_new_items(
+                "http://olx", existing_urls=set(), summarizer=None
+            )
+
+        self.assertEqual(items, [])
+
     async def test_parse_times(self):
         scr = self.OLXScraper()
         dt, pretty = scr._parse_times("12:00")
         self.assertIsNotNone(dt)
         self.assertIsInstance(pretty, str)
 
+    async def test_parse_times_handles_unpadded_hour(self):
+        from datetime import datetime, timezone
+
+        now = datetime(2024, 1, 15, 20, 0, tzinfo=timezone.utc)
+        scr = self.OLXScraper()
+        dt, pretty = scr._parse_times("09:05", now=now)
+        # Non "HH:MM" input falls back to strptime with the same result
+        self.assertEqual(scr._parse_times("9:05", now=now), (dt, pretty))
+        self.assertEqual(dt, datetime(2024, 1, 15, 10, 5))
+        self.assertEqual(pretty, "15.01.2024 - *10:05*")
+
     async def test_fetch_new_items_skips_non_today_items(self):
         """Test that items without 'Dzisiaj' are skipped."""
         html_with_old = """
@@ -123,7 +162,7 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
           </div>
         </body></html>
         """
-        list_resp = MagicMock(status_code=200, text=html_with_old)
+        list_resp = MagicMock(status_code=200, content=html_with_old.encode())
 
         with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=list_resp)):
             scr = self.OLXScraper()
@@ -136,7 +175,7 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
 
     async def test_fetch_new_items_skips_existing_urls(self):
         """Test that items with URLs in existing_urls are skipped."""
-        list_resp = MagicMock(status_code=200, text=OLX_LISTING_HTML)
+        list_resp = MagicMock(status_code=200, content=OLX_LISTING_HTML.encode())
 
         with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=list_resp)):
             with patch(
@@ -168,8 +207,8 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
           </div>
         </body></html>
         """
-        list_resp = MagicMock(status_code=200, text=html_relative)
-        detail_resp = MagicMock(status_code=200, text=DETAIL_HTML)
+        list_resp = MagicMock(status_code=200, content=html_relative.encode())
+        detail_resp = MagicMock(status_code=200, content=DETAIL_HTML.encode())
 
         with patch(
             "httpx.AsyncClient.get", new=AsyncMock(side_effect=[list_resp, detail_resp])
@@ -205,8 +244,8 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
           <img data-testid="swiper-image-1" src="http://highres.jpg"/>
         </body></html>
         """
-        list_resp = MagicMock(status_code=200, text=html_with_img)
-        detail_resp = MagicMock(status_code=200, text=detail_with_highres)
+        list_resp = MagicMock(status_code=200, content=html_with_img.encode())
+        detail_resp = MagicMock(status_code=200, content=detail_with_highres.encode())
 
         with patch(
             "httpx.AsyncClient.get", new=AsyncMock(side_effect=[list_resp, detail_resp])
@@ -224,6 +263,67 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0].image_url, "http://highres.jpg")
 
+    async def test_fetch_new_items_fetches_details_concurrently_in_order(self):
+        """Test that details from concurrent fetches are matched to their items."""
+        html_two_items = """
+        <html><body>
+          <div data-testid="l-card">
+            <p data-testid="location-date">Warszawa - Dzisiaj o 12:34</p>
+            <div data-cy="ad-card-title"><a href="/oferta/a">First</a></div>
+          </div>
+          <div data-testid="l-card">
+            <p data-testid="location-date">Warszawa - Dzisiaj o 12:35</p>
+            <div data-cy="ad-card-title"><a href="/oferta/b">Second</a></div>
+          </div>
+        </body></html>
+        """
+        detail_a = (
+            '<html><body><div data-cy="ad_description">Desc A</div></body></html>'
+        )
+        detail_b = (
+            '<html><body><div data-cy="ad_description">Desc B</div></body></html>'
+        )
+        list_resp = MagicMock(status_code=200, content=html_two_items.encode())
+        detail_a_resp = MagicMock(status_code=200, content=detail_a.encode())
+        detail_b_resp = MagicMock(status_code=200, content=detail_b.encode())
+
+        with patch(
+            "httpx.AsyncClient.get",
+            new=AsyncMock(side_effect=[list_resp, detail_a_resp, detail_b_resp]),
+        ):
+            with patch(
+                "tools.utils.time_helpers.TimeUtils.within_last_minutes",
+                return_value=True,
+            ):
+                scr = self.OLXScraper()
+                summarizer = types.SimpleNamespace(summarize=AsyncMock())
+                items = await scr.fetch_new_items(
+                    "http://olx", existing_urls=set(), summarizer=summarizer
+                )
+
+        self.assertEqual([it.title for it in items], ["First", "Second"])
+        self.assertEqual([it.description for it in items], ["Desc A", "Desc B"])
+
+    async def test_fetch_new_items_shares_detail_semaphore_across_calls(self):
+        """Detail fetches go through the base fan-out with the scraper-wide limit."""
+        list_resp = MagicMock(status_code=200, content=OLX_LISTING_HTML.encode())
+        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=list_resp)):
+            with patch(
+                "tools.utils.time_helpers.TimeUtils.within_last_minutes",
+                side_effect=[True, False],
+            ):
+                scr = self.OLXScraper()
+                with patch.object(
+                    scr,
+                    "fetch_item_details_many",
+                    new=AsyncMock(return_value=[("Desc", "")]),
+                ) as many:
+                    await scr.fetch_new_items(
+                        "http://olx", existing_urls=set(), summarizer=None
+                    )
+
+        self.assertIs(many.await_args.kwargs["semaphore"], scr._detail_semaphore)
+
     async def test_get_detail_fetcher_lazy_loads_scrapers(self):
         """Test that detail fetchers are lazy-loaded and cached."""
         scr = self.OLXScraper()
@@ -246,7 +346,7 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
             mock_otodom_class.assert_called_once()
 
     async def test_close_closes_delegated_scrapers(self):
-        """Test that close() closes all delegated scrapers."""
+        """Test that close() closes delegated scrapers but not the shared client."""
         scr = self.OLXScraper()
 
         # Create a mock delegated scraper
@@ -257,18 +357,38 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
         with patch.object(scr.client, "aclose", new=AsyncMock()) as mock_client_close:
             await scr.close()
 
-            # Verify client was closed
-            mock_client_close.assert_awaited_once()
+            # The shared client outlives the scraper
+            mock_client_close.assert_not_awaited()
             # Verify delegated scraper was closed
             mock_delegated.close.assert_awaited_once()
 
+            # Closing again is a no-op
+            await scr.close()
+            mock_delegated.close.assert_awaited_once()
+
+    async def test_scrapers_share_one_http_client(self):
+        """Test that OLX and delegated scrapers reuse the shared client."""
+        from tools.scraping.base import close_shared_client, get_shared_client
+        from tools.scraping.otodom import OtodomScraper
+
+        scr = self.OLXScraper()
+        self.assertIs(scr.client, get_shared_client())
+        self.assertIs(OtodomScraper().client, scr.client)
+
+        with patch.object(scr.client, "aclose", new=AsyncMock()) as mock_client_close:
+            await close_shared_client()
+            mock_client_close.assert_awaited_once()
+
+        # A fresh client is created after the shared one is closed
+        self.assertIsNot(get_shared_client(), scr.client)
+
     async def test_extract_highres_image_handles_missing_tag(self):
         """Test _extract_highres_image returns empty string when img tag is missing."""
         html_no_img = "<html><body><div>No image here</div></body></html>"
-        soup = BeautifulSoup(html_no_img, "html.parser")
+        tree = lxml.html.fromstring(html_no_img)
 
         scr = self.OLXScraper()
-        result = scr._extract_highres_image(soup)
+        result = scr._extract_highres_image(tree)
 
         self.assertEqual(result, "")
 
@@ -280,10 +400,10 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
                srcset="http://a.jpg 200w, http://b.jpg 800w"/>
         </body></html>
         """
-        soup = BeautifulSoup(html_with_src, "html.parser")
+        tree = lxml.html.fromstring(html_with_src)
 
         scr = self.OLXScraper()
-        result = scr._extract_highres_image(soup)
+        result = scr._extract_highres_image(tree)
 
         self.assertEqual(result, "http://direct.jpg")
 
@@ -294,22 +414,21 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
           <img data-testid="swiper-image-1" srcset="invalid format, http://good.jpg 800w"/>
         </body></html>
         """
-        soup = BeautifulSoup(html_bad_srcset, "html.parser")
+        tree = lxml.html.fromstring(html_bad_srcset)
 
         scr = self.OLXScraper()
-        result = scr._extract_highres_image(soup)
+        result = scr._extract_highres_image(tree)
 
         # Should return the valid one
         self.assertEqual(result, "http://good.jpg")
 
     async def test_extract_highres_image_handles_exception(self):
         """Test _extract_highres_image returns empty string on exception."""
-        # Create a soup that will cause an exception
-        soup = MagicMock()
-        soup.find.side_effect = Exception("Test exception")
+        # Pass something that is not an lxml element so evaluation fails
+        tree = MagicMock()
 
         scr = self.OLXScraper()
-        result = scr._extract_highres_image(soup)
+        result = scr._extract_highres_image(tree)
 
         self.assertEqual(result, "")
 
@@ -320,9 +439,9 @@ class TestOLXScraper(IsolatedAsyncioTestCase):
           <img data-testid="swiper-image-1" srcset=""/>
         </body></html>
         """
-        soup = BeautifulSoup(html_empty_srcset, "html.parser")
+        tree = lxml.html.fromstring(html_empty_srcset)
 
         scr = self.OLXScraper()
-        result = scr._extract_highres_image(soup)
+        result = scr._extract_highres_image(tree)
 
         self.assertEqual(result, "")
@@ -1,8 +1,12 @@
 import json
-import os
 import types
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
+
+from bs4 import BeautifulSoup
+
+# Env vars and the langchain_groq stub are provided by tests/conftest.py
+from tools.scraping.otodom import OtodomScraper
 
 # Sample Otodom __NEXT_DATA__ JSON structure
 OTODOM_NEXT_DATA_JSON = {
@@ -57,21 +61,24 @@ OTODOM_DETAIL_HTML_TEMPLATE = """
 """
 
 
-class TestOtodomScraper(IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
-        os.environ.setdefault("TOPN_DB_BASE_URL", "http://api")
-        os.environ.setdefault("GROQ_MODEL_NAME", "dummy")
-        import sys
-
-        sys.modules.setdefault(
-            "langchain_groq",
-            types.SimpleNamespace(
-                ChatGroq=type("ChatGroq", (), {"__init__": lambda *a, **k: None})
-            ),
-        )
+def _response(content: bytes, raise_for_status=lambda: None):
+    """Lightweight stand-in for an httpx.Response."""
+    return types.SimpleNamespace(
+        status_code=200, content=content, raise_for_status=raise_for_status
+    )
+
 
-        from tools.scraping.otodom import OtodomScraper
+def _get_returning(response):
+    """Build a replacement for AsyncClient.get that always returns *response*."""
 
+    async def get(*args, **kwargs):
+        return response
+
+    return get
+
+
+class TestOtodomScraper(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
         self.OtodomScraper = OtodomScraper
 
     async def asyncTearDown(self):
@@ -96,10 +103,9 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
         html_content = OTODOM_DETAIL_HTML_TEMPLATE.format(
             json_data=json.dumps(OTODOM_NEXT_DATA_JSON)
         )
-        mock_response = MagicMock(status_code=200, text=html_content)
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _response(html_content.encode())
 
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
             scr = self.OtodomScraper()
             summarizer = types.SimpleNamespace(summarize=AsyncMock())
             desc, img = await scr.fetch_item_details(
@@ -115,10 +121,9 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
         html_content = OTODOM_DETAIL_HTML_TEMPLATE.format(
             json_data=json.dumps(OTODOM_NEXT_DATA_PHOTOS_JSON)
         )
-        mock_response = MagicMock(status_code=200, text=html_content)
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _response(html_content.encode())
 
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
             scr = self.OtodomScraper()
             summarizer = types.SimpleNamespace(summarize=AsyncMock())
             desc, img = await scr.fetch_item_details(
@@ -133,10 +138,9 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
         html_content = OTODOM_DETAIL_HTML_TEMPLATE.format(
             json_data=json.dumps(OTODOM_NEXT_DATA_EMPTY)
         )
-        mock_response = MagicMock(status_code=200, text=html_content)
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _response(html_content.encode())
 
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
             scr = self.OtodomScraper()
             summarizer = types.SimpleNamespace(summarize=AsyncMock())
             desc, img = await scr.fetch_item_details(
@@ -149,10 +153,9 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
     async def test_fetch_item_details_handles_missing_script_tag(self):
         """Test handling when __NEXT_DATA__ script tag is missing."""
         html_content = "<html><body>No script tag here</body></html>"
-        mock_response = MagicMock(status_code=200, text=html_content)
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _response(html_content.encode())
 
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
             scr = self.OtodomScraper()
             summarizer = types.SimpleNamespace(summarize=AsyncMock())
             desc, img = await scr.fetch_item_details(
@@ -171,10 +174,9 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
         </head>
         </html>
         """
-        mock_response = MagicMock(status_code=200, text=html_content)
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _response(html_content.encode())
 
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
             with patch("tools.scraping.otodom.logger") as mock_logger:
                 scr = self.OtodomScraper()
                 summarizer = types.SimpleNamespace(summarize=AsyncMock())
@@ -187,12 +189,121 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
         mock_logger.warning.assert_called_once()
         self.assertIn("Invalid JSON", mock_logger.warning.call_args[0][0])
 
+    async def test_fetch_item_details_skips_html_parse_when_marker_found(self):
+        """Test that __NEXT_DATA__ is sliced from raw bytes without BeautifulSoup."""
+        html_content = OTODOM_DETAIL_HTML_TEMPLATE.format(
+            json_data=json.dumps(OTODOM_NEXT_DATA_JSON)
+        )
+        mock_response = _response(html_content.encode())
+
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
+            with patch(
+                "tools.scraping.otodom.BeautifulSoup", wraps=BeautifulSoup
+            ) as bs:
+                scr = self.OtodomScraper()
+                summarizer = types.SimpleNamespace(summarize=AsyncMock())
+                desc, img = await scr.fetch_item_details(
+                    "http://otodom.pl/property/123", summarizer
+                )
+
+        self.assertIn("Beautiful apartment", desc)
+        self.assertEqual(img, "http://otodom.img/large1.jpg")
+        # Only the description fragment is parsed, never the whole page
+        self.assertNotIn(html_content.encode(), [c.args[0] for c in bs.call_args_list])
+
+    async def test_fetch_item_details_falls_back_to_full_parse(self):
+        """Test the BeautifulSoup path when the byte marker does not match."""
+        html_content = (
+            "<html><head><script id='__NEXT_DATA__' type='application/json'>"
+            f"{json.dumps(OTODOM_NEXT_DATA_PHOTOS_JSON)}</script></head></html>"
+        )
+        mock_response = _response(html_content.encode())
+
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
+            scr = self.OtodomScraper()
+            summarizer = types.SimpleNamespace(summarize=AsyncMock())
+            desc, img = await scr.fetch_item_details(
+                "http://otodom.pl/property/456", summarizer
+            )
+
+        self.assertEqual(desc, "Simple description text")
+        self.assertEqual(img, "http://otodom.img/photo1.jpg")
+
+    async def test_parse_next_data_handles_missing_ad(self):
+        """Test payloads without a usable props.pageProps.ad object."""
+        for payload in [
+            {"props": {"pageProps": {}}},
+            {"props": {"pageProps": {"ad": None}}},
+            {"props": []},
+            [],
+        ]:
+            self.assertEqual(
+                self.OtodomScraper._parse_next_data(json.dumps(payload)), ("", "")
+            )
+
+    async def test_parse_next_data_accepts_lone_surrogate_escapes(self):
+        """Test that a description cut mid-emoji still yields the listing."""
+        payload = (
+            '{"props": {"pageProps": {"ad": {"description": "Balkon \\ud83d",'
+            ' "images": [{"large": "http://x.jpg"}]}}}}'
+        )
+
+        with patch("tools.scraping.otodom.logger") as mock_logger:
+            desc, img = self.OtodomScraper._parse_next_data(payload.encode())
+
+        self.assertEqual(desc, "Balkon")
+        self.assertEqual(img, "http://x.jpg")
+        mock_logger.warning.assert_not_called()
+
+    async def test_slice_next_data(self):
+        """Test slicing the __NEXT_DATA__ payload out of raw page bytes."""
+        body = OTODOM_DETAIL_HTML_TEMPLATE.format(json_data='{"a": 1}').encode()
+        self.assertEqual(self.OtodomScraper._slice_next_data(body), b'{"a": 1}')
+        self.assertIsNone(self.OtodomScraper._slice_next_data(b"<html></html>"))
+        # Truncated page: opening tag present but no closing </script>
+        self.assertIsNone(
+            self.OtodomScraper._slice_next_data(b'<script id="__NEXT_DATA__">{"a"')
+        )
+
+    async def test_fetch_item_details_reuses_cached_result(self):
+        """Test that a listing is fetched once within the cache TTL."""
+        html_content = OTODOM_DETAIL_HTML_TEMPLATE.format(
+            json_data=json.dumps(OTODOM_NEXT_DATA_PHOTOS_JSON)
+        )
+        get = AsyncMock(return_value=_response(html_content.encode()))
+
+        with patch("httpx.AsyncClient.get", new=get):
+            scr = self.OtodomScraper()
+            first = await scr.fetch_item_details("http://otodom.pl/property/1", None)
+            second = await scr.fetch_item_details("http://otodom.pl/property/1", None)
+            self.assertEqual(first, second)
+            get.assert_awaited_once()
+
+            # Expired entries are fetched again
+            scr.DETAILS_CACHE_TTL_SECONDS = 0
+            await scr.fetch_item_details("http://otodom.pl/property/1", None)
+            self.assertEqual(get.await_count, 2)
+
+    async def test_details_cache_evicts_least_recently_used(self):
+        """Test that the details cache stays within DETAILS_CACHE_MAXSIZE."""
+        scr = self.OtodomScraper()
+        scr.DETAILS_CACHE_MAXSIZE = 2
+        scr._remember_details("a", 0.0, ("A", ""))
+        scr._remember_details("b", 0.0, ("B", ""))
+        scr._details_cache.move_to_end("a")
+        scr._remember_details("c", 0.0, ("C", ""))
+
+        self.assertEqual(list(scr._details_cache), ["a", "c"])
+
     async def test_fetch_item_details_handles_http_error(self):
         """Test error handling when HTTP request fails."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = Exception("404 Not Found")
 
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
+        def raise_for_status():
+            raise Exception("404 Not Found")
+
+        mock_response = _response(b"", raise_for_status=raise_for_status)
+
+        with patch("httpx.AsyncClient.get", new=_get_returning(mock_response)):
             with patch("tools.scraping.otodom.logger") as mock_logger:
                 scr = self.OtodomScraper()
                 summarizer = types.SimpleNamespace(summarize=AsyncMock())
@@ -206,8 +317,6 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
 
     async def test_extract_from_next_data_with_html_entities(self):
         """Test that HTML entities in description are properly unescaped."""
-        from bs4 import BeautifulSoup
-
         json_data = {
             "props": {
                 "pageProps": {
@@ -231,8 +340,6 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
 
     async def test_extract_from_next_data_image_priority(self):
         """Test that 'large' image is preferred over other sizes."""
-        from bs4 import BeautifulSoup
-
         json_data = {
             "props": {
                 "pageProps": {
@@ -261,8 +368,6 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
 
     async def test_extract_from_next_data_fallback_to_medium(self):
         """Test fallback to 'medium' when 'large' is not available."""
-        from bs4 import BeautifulSoup
-
         json_data = {
             "props": {
                 "pageProps": {
@@ -290,8 +395,6 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
 
     async def test_extract_from_next_data_handles_non_string_image_values(self):
         """Test that non-string image values are skipped."""
-        from bs4 import BeautifulSoup
-
         json_data = {
             "props": {
                 "pageProps": {
@@ -314,10 +417,86 @@ class TestOtodomScraper(IsolatedAsyncioTestCase):
 
         self.assertEqual(img, "http://valid.jpg")
 
-    async def test_close_closes_client(self):
-        """Test that close method properly closes the httpx client."""
+    async def test_extract_from_next_data_skips_empty_image_urls(self):
+        """Test that an empty image URL falls through to the next image."""
+        json_data = {
+            "props": {
+                "pageProps": {
+                    "ad": {
+                        "description": "Test",
+                        "images": [{"large": ""}, {"large": "http://x.jpg"}],
+                    }
+                }
+            }
+        }
+        html_content = OTODOM_DETAIL_HTML_TEMPLATE.format(
+            json_data=json.dumps(json_data)
+        )
+        soup = BeautifulSoup(html_content, "html.parser")
+
+        scr = self.OtodomScraper()
+        desc, img = scr._extract_from_next_data(soup)
+
+        self.assertEqual(img, "http://x.jpg")
+
+    async def test_html_to_text_puts_each_visible_text_node_on_a_line(self):
+        """Test that comments and scripts are dropped from the description."""
+        from tools.scraping.otodom import _html_to_text
+
+        fragment = (
+            "<p>Two rooms <!-- hidden --> <b>near</b> the park</p>"
+            "<ul><li>Balcony</li><li>Garage &amp; storage</li></ul>"
+            "<script>tracking()</script>Available now"
+        )
+        self.assertEqual(
+            _html_to_text(fragment),
+            "Two rooms\nnear\nthe park\nBalcony\nGarage & storage\nAvailable now",
+        )
+        self.assertEqual(_html_to_text("Plain text"), "Plain text")
+        self.assertEqual(_html_to_text(""), "")
+
+    async def test_html_to_text_collapses_whitespace_within_a_node(self):
+        """Test that whitespace runs, NBSPs included, become one space."""
+        from tools.scraping.otodom import _html_to_text
+
+        self.assertEqual(_html_to_text("<p>x&nbsp;y</p>"), "x y")
+        # Node boundaries stay lines; empty nodes are dropped
+        self.assertEqual(
+            _html_to_text("<p>Two\n      rooms,\xa0 balcony</p><p> Garage </p>"),
+            "Two rooms, balcony\nGarage",
+        )
+
+    async def test_html_to_text_tolerates_control_characters(self):
+        """Test that XML-incompatible control characters do not break parsing."""
+        from tools.scraping.otodom import _html_to_text
+
+        self.assertEqual(_html_to_text("Mieszkanie\x0b3 pokoje"), "Mieszkanie 3 pokoje")
+        self.assertEqual(_html_to_text("<p>a\x1fb</p>\x00c"), "a b\nc")
+
+    async def test_parse_next_data_keeps_description_with_control_characters(self):
+        """Test that a vertical tab in a plain-text description is not fatal."""
+        payload = json.dumps(
+            {
+                "props": {
+                    "pageProps": {
+                        "ad": {
+                            "description": "Mieszkanie\u000b3 pokoje",
+                            "images": [{"large": "http://x.jpg"}],
+                        }
+                    }
+                }
+            }
+        )
+
+        self.assertEqual(
+            self.OtodomScraper._parse_next_data(payload),
+            ("Mieszkanie 3 pokoje", "http://x.jpg"),
+        )
+
+    async def test_close_leaves_shared_client_open(self):
+        """Test that close does not close the client shared with other scrapers."""
         scr = self.OtodomScraper()
 
         with patch.object(scr.client, "aclose", new=AsyncMock()) as mock_close:
             await scr.close()
-            mock_close.assert_awaited_once()
+            mock_close.assert_not_awaited()
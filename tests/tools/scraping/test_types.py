@@ -0,0 +1,51 @@
+from unittest import IsolatedAsyncioTestCase
+from urllib.parse import urlparse
+
+from tools.scraping.types import (
+    ScraperType,
+    _netloc,
+    get_proper_scraper,
+    get_scraper_registry,
+)
+
+
+class TestGetProperScraper(IsolatedAsyncioTestCase):
+    async def test_routes_by_host(self):
+        self.assertEqual(
+            get_proper_scraper("https://www.otodom.pl/pl/oferta/1"),
+            ScraperType.OTODOM,
+        )
+        self.assertEqual(
+            get_proper_scraper("https://www.OLX.pl/d/oferta/1"), ScraperType.OLX
+        )
+
+    async def test_defaults_to_olx(self):
+        self.assertEqual(get_proper_scraper("https://example.com/"), ScraperType.OLX)
+        # "otodom" outside the host must not route to Otodom
+        self.assertEqual(
+            get_proper_scraper("https://example.com/?ref=otodom"), ScraperType.OLX
+        )
+        self.assertEqual(get_proper_scraper("otodom.pl/oferta"), ScraperType.OLX)
+
+    async def test_netloc_matches_urlparse(self):
+        for url in [
+            "https://www.olx.pl/d/oferta/1",
+            "http://a?x=otodom",
+            "https://user:pw@otodom.pl:443/x#frag",
+            "//otodom.pl/x",
+            "otodom.pl/x",
+            "mailto:someone",
+            "",
+        ]:
+            self.assertEqual(_netloc(url), urlparse(url).netloc, url)
+
+
+class TestGetScraperRegistry(IsolatedAsyncioTestCase):
+    async def test_registry_is_built_once(self):
+        from tools.scraping.olx import OLXScraper
+        from tools.scraping.otodom import OtodomScraper
+
+        registry = get_scraper_registry()
+        self.assertIs(registry[ScraperType.OLX], OLXScraper)
+        self.assertIs(registry[ScraperType.OTODOM], OtodomScraper)
+        self.assertIs(get_scraper_registry(), registry)
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from unittest import IsolatedAsyncioTestCase
 
 from tools.utils.time_helpers import TimeUtils
@@ -15,5 +16,10 @@ class TestTimeUtils(IsolatedAsyncioTestCase):
         self.assertTrue(TimeUtils.within_last_minutes("23:59", n=24 * 60))
         self.assertFalse(TimeUtils.within_last_minutes("00:00", n=0))
 
+    async def test_within_last_minutes_uses_given_now(self):
+        now = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+        self.assertTrue(TimeUtils.within_last_minutes("12:20", n=15, now=now))
+        self.assertFalse(TimeUtils.within_last_minutes("12:10", n=15, now=now))
+
     async def test_invalid_format_returns_false(self):
         self.assertFalse(TimeUtils.within_last_minutes("bad", n=10))
@@ -7,14 +7,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
-import pytz
-
+from core.config import get_settings
 from models import Item
 from tools.processing.description import DescriptionSummarizer
-from tools.scraping.base import BaseScraper
+from tools.scraping.base import BaseScraper, close_shared_client
 from tools.scraping.types import get_proper_scraper
 
 if TYPE_CHECKING:
@@ -22,20 +23,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_PL_TZ = ZoneInfo("Europe/Warsaw")
+
 
 class ItemMonitor:
     """Periodically checks all `MonitoringTask` URLs using the provided scraper."""
 
+    # Maximum create_item requests in flight for one batch of new items
+    MAX_CONCURRENT_PERSISTS = 8
+
     def __init__(
         self,
         db_client: "TopnDbClient",
         scraper_cls: type[BaseScraper],
-        cycle_sleep_seconds: int = 3,
+        max_concurrent_urls: int = 4,
+        min_url_interval_seconds: float = 1.0,
+        existing_urls_ttl_seconds: float | None = None,
     ) -> None:
         self.db_client = db_client
         self.scraper: BaseScraper = scraper_cls()
         self.summarizer = DescriptionSummarizer()
-        self.cycle_sleep_seconds = cycle_sleep_seconds
+        self.max_concurrent_urls = max_concurrent_urls
+        self.min_url_interval_seconds = min_url_interval_seconds
+        # Marketplace origin -> lock serialising the wait, and the monotonic
+        # time the next scrape of that origin may start
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._host_next_start: dict[str, float] = {}
+        # How long the already-stored item URLs of a source URL are reused
+        # before they are fetched from the API again
+        if existing_urls_ttl_seconds is None:
+            existing_urls_ttl_seconds = get_settings().EXISTING_URLS_CACHE_SECONDS
+        self.existing_urls_ttl_seconds = existing_urls_ttl_seconds
+        # source URL -> (monotonic fetch time, item URLs already stored)
+        self._existing_cache: dict[str, tuple[float, set[str]]] = {}
 
     async def run_once(self):
         """Scrape each task URL once and persist new items."""
@@ -44,71 +64,180 @@ class ItemMonitor:
             tasks_response = await self.db_client.get_all_tasks()
             tasks = tasks_response.get("tasks", [])
 
-            # Extract distinct URLs
-            distinct_urls = list({task["url"] for task in tasks})
+            # Extract distinct URLs, keeping the order tasks were returned in
+            distinct_urls = list(dict.fromkeys(task["url"] for task in tasks))
             logger.info(
                 "ItemMonitor starting scraping loop for %s URLs", len(distinct_urls)
             )
-
-            for url in distinct_urls:
-                try:
-                    # Get existing items for this source URL
-                    items_response = await self.db_client.get_items_by_source_url(
-                        url, limit=10000
-                    )
-                    existing_items = items_response.get("items", [])
-                    existing_urls = {item["item_url"] for item in existing_items}
-
-                    new_items = await self.scraper.fetch_new_items(
-                        url=url,
-                        existing_urls=existing_urls,
-                        summarizer=self.summarizer,
-                    )
-                except Exception as exc:
+            self._forget_stale_urls(distinct_urls)
+
+            # Each URL is independent I/O; process them concurrently with a
+            # bounded number in flight
+            semaphore = asyncio.Semaphore(self.max_concurrent_urls)
+            results = await asyncio.gather(
+                *(self._process_url(url, semaphore) for url in distinct_urls),
+                return_exceptions=True,
+            )
+            # One failing URL must not stop the others, but must not go
+            # unnoticed either
+            for url, result in zip(distinct_urls, results):
+                if isinstance(result, BaseException):
                     logger.error(
-                        "Failed fetching items for %s: %s", url, exc, exc_info=True
+                        "Error processing %s: %s", url, result, exc_info=result
                     )
-                    continue
-
-                await self._persist_items(new_items, source_url=url)
-                logger.info("URL %s processed; added %s new items", url, len(new_items))
-
-                await asyncio.sleep(self.cycle_sleep_seconds)
 
             logger.info("ItemMonitor finished all URLs")
         except Exception as exc:
             logger.error("Error in run_once: %s", exc, exc_info=True)
             raise
 
-    async def _persist_items(self, items: list[Item], source_url: str):
-        poland_tz = pytz.timezone("Europe/Warsaw")
-        for item in items:
-            # Use enum-based scraper detection for source
-            scraper_type = get_proper_scraper(item.item_url)
-            source = (
-                scraper_type.value.upper()
-            )  # Convert "olx" -> "OLX", "otodom" -> "OTODOM"
-
-            item_data = {
-                "item_url": item.item_url,
-                "title": item.title,
-                "price": item.price,
-                "location": item.location,
-                "created_at": item.created_at.isoformat() if item.created_at else None,
-                "created_at_pretty": item.created_at_pretty,
-                "image_url": item.image_url,
-                "description": item.description,
-                "source_url": source_url,
-                "source": source,
-                "first_seen": datetime.now(poland_tz).replace(tzinfo=None).isoformat(),
-            }
+    def _forget_stale_urls(self, urls: list[str]) -> None:
+        """Drop cached state of URLs and hosts no task refers to any more.
+
+        The worker runs for the life of the process, so without this every
+        deleted task would keep its existing-URL set in memory forever.
+        """
+        active_urls = set(urls)
+        for url in self._existing_cache.keys() - active_urls:
+            del self._existing_cache[url]
+
+        active_origins = {_origin(url) for url in active_urls}
+        for origin in self._host_next_start.keys() - active_origins:
+            del self._host_next_start[origin]
+        for origin in self._host_locks.keys() - active_origins:
+            del self._host_locks[origin]
+
+    async def _process_url(self, url: str, semaphore: asyncio.Semaphore) -> None:
+        """Scrape a single task URL and persist the new items it yields."""
+        async with semaphore:
             try:
-                await self.db_client.create_item(item_data)
-                logger.info("New item persisted: %s | %s", item.title, item.item_url)
+                existing_urls = await self._get_existing_urls(url)
+
+                await self._throttle_host(url)
+                new_items = await self.scraper.fetch_new_items(
+                    url=url,
+                    existing_urls=existing_urls,
+                    summarizer=self.summarizer,
+                )
             except Exception as exc:
                 logger.error(
-                    "Failed to persist item %s: %s", item.item_url, exc, exc_info=True
+                    "Failed fetching items for %s: %s", url, exc, exc_info=True
+                )
+                return
+
+            await self._persist_items(new_items, source_url=url)
+            logger.info("URL %s processed; added %s new items", url, len(new_items))
+
+    async def _throttle_host(self, url: str) -> None:
+        """Space out scrape starts against the same marketplace host.
+
+        URLs are processed concurrently, so without this every task URL on a
+        host would hit it at the same moment at the start of a cycle.
+        """
+        origin = _origin(url)
+        lock = self._host_locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            delay = self._host_next_start.get(origin, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._host_next_start[origin] = (
+                time.monotonic() + self.min_url_interval_seconds
+            )
+
+    async def _get_existing_urls(self, source_url: str) -> set[str]:
+        """Return item URLs already stored for *source_url*, cached for a TTL."""
+        now = time.monotonic()
+        cached = self._existing_cache.get(source_url)
+        if cached is not None and now - cached[0] < self.existing_urls_ttl_seconds:
+            return cached[1]
+
+        items_response = await self.db_client.get_items_by_source_url(
+            source_url, limit=10000
+        )
+        existing_urls = {item["item_url"] for item in items_response.get("items", [])}
+        self._existing_cache[source_url] = (now, existing_urls)
+        return existing_urls
+
+    async def _persist_items(self, items: list[Item], source_url: str):
+        first_seen = datetime.now(_PL_TZ).replace(tzinfo=None).isoformat()
+        # Items normally live on the same host as the search page, so resolve
+        # the source once and only re-derive it for delegated hosts
+        origin = _origin(source_url)
+        batch_source = _source_for(source_url)
+        # Build every payload before any request is started, so a bad item
+        # cannot leave already-created coroutines un-awaited
+        payloads = [
+            _build_item_data(
+                item,
+                source_url,
+                first_seen,
+                (
+                    batch_source
+                    if item.item_url.startswith(origin)
+                    else _source_for(item.item_url)
+                ),
+            )
+            for item in items
+        ]
+
+        # Items are independent records; send them to the API concurrently,
+        # with a bounded number in flight so a large first scrape does not
+        # flood the DB API
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PERSISTS)
+
+        async def create(payload: dict):
+            async with semaphore:
+                return await self.db_client.create_item(payload)
+
+        results = await asyncio.gather(
+            *(create(payload) for payload in payloads), return_exceptions=True
+        )
+        persisted_urls = []
+        for item, result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to persist item %s: %s",
+                    item.item_url,
+                    result,
+                    exc_info=result,
                 )
+            else:
+                persisted_urls.append(item.item_url)
+                logger.info("New item persisted: %s | %s", item.title, item.item_url)
+
+        # Keep the cached URL set in step with what was just stored so the
+        # next cycle does not report these items again
+        cached = self._existing_cache.get(source_url)
+        if cached is not None:
+            cached[1].update(persisted_urls)
 
     async def close(self):
         await self.scraper.close()
+        await close_shared_client()
+
+
+def _origin(url: str) -> str:
+    """Return the ``scheme://host/`` prefix of *url*."""
+    return "/".join(url.split("/", 3)[:3]) + "/"
+
+
+def _source_for(url: str) -> str:
+    """Return the value stored in the item "source" field for *url*."""
+    return get_proper_scraper(url).value.upper()
+
+
+def _build_item_data(item: Item, source_url: str, first_seen: str, source: str) -> dict:
+    """Build the create_item payload for a scraped item."""
+    return {
+        "item_url": item.item_url,
+        "title": item.title,
+        "price": item.price,
+        "location": item.location,
+        "created_at": item.created_at.isoformat() if item.created_at else None,
+        "created_at_pretty": item.created_at_pretty,
+        "image_url": item.image_url,
+        "description": item.description,
+        "source_url": source_url,
+        "source": source,
+        "first_seen": first_seen,
+    }
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+from typing import List
 
-from core.config import settings
+from core.config import get_settings
 from prompts import get_description_summary_prompt
 
 logger = logging.getLogger(__name__)
@@ -15,10 +16,36 @@ class DescriptionSummarizer:
 
     async def summarize(self, description: str) -> str:
         try:
-            response = await settings.GENERATIVE_MODEL.ainvoke(
+            response = await get_settings().GENERATIVE_MODEL.ainvoke(
                 input=get_description_summary_prompt(description)
             )
             return response.content
         except Exception as exc:  # pragma: no cover
             logger.error("Failed summarising description: %s", exc, exc_info=True)
             return ""
+
+    async def summarize_many(self, descriptions: List[str]) -> List[str]:
+        """Summarise several descriptions with one batched model call.
+
+        Results keep the input order; a description that fails to summarise
+        yields "" without affecting the others.
+        """
+        if not descriptions:
+            return []
+        try:
+            responses = await get_settings().GENERATIVE_MODEL.abatch(
+                [get_description_summary_prompt(d) for d in descriptions],
+                return_exceptions=True,
+            )
+        except Exception as exc:  # pragma: no cover
+            logger.error("Failed summarising descriptions: %s", exc, exc_info=True)
+            return [""] * len(descriptions)
+
+        summaries: List[str] = []
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error("Failed summarising description: %s", response)
+                summaries.append("")
+            else:
+                summaries.append(response.content)
+        return summaries
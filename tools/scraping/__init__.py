@@ -1,6 +1,6 @@
 """Scraping module with marketplace-specific scrapers."""
 
-from .base import BaseScraper
+from .base import BaseScraper, close_shared_client, get_shared_client
 from .types import ScraperType, get_proper_scraper, get_scraper_registry
 
 
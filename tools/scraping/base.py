@@ -6,14 +6,20 @@ subclassing `BaseScraper` and implementing the abstract methods.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Set
+from typing import List, Optional, Set
+
+import httpx
 
 from models import Item
 from tools.processing.description import (  # noqa: F401 pylint: disable=cyclic-import
     DescriptionSummarizer,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class BaseScraper(ABC):
     """Interface that every marketplace‐specific scraper must implement."""
@@ -30,6 +36,10 @@ class BaseScraper(ABC):
         "CF-IPCountry": "PL",
     }
 
+    # Maximum detail pages fetched at once by fetch_item_details_many() when
+    # the caller does not pass a semaphore of its own
+    DETAIL_FETCH_CONCURRENCY = 32
+
     @abstractmethod
     async def fetch_new_items(
         self,
@@ -59,6 +69,89 @@ class BaseScraper(ABC):
             tuple[description, highres_image_url]
         """
 
+    async def fetch_item_details_many(
+        self,
+        item_urls: List[str],
+        summarizer: "DescriptionSummarizer",
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[tuple[str, str]]:
+        """Fetch details for several items concurrently, preserving their order.
+
+        A failed fetch does not cancel the others; it is logged and reported as
+        a "Failed to load description" tuple like the scrapers do themselves.
+
+        Args:
+            item_urls: URLs of the item listings.
+            summarizer: Helper used to summarise raw item descriptions.
+            semaphore: Limits requests in flight. Pass a long-lived one to share
+                the limit across calls; defaults to a fresh semaphore sized
+                DETAIL_FETCH_CONCURRENCY.
+
+        Returns:
+            One (description, highres_image_url) tuple per URL, in order.
+        """
+        if semaphore is None:
+            semaphore = asyncio.BoundedSemaphore(self.DETAIL_FETCH_CONCURRENCY)
+
+        async def fetch_one(item_url: str) -> tuple[str, str]:
+            async with semaphore:
+                return await self._fetch_item_details(item_url, summarizer)
+
+        results = await asyncio.gather(
+            *(fetch_one(item_url) for item_url in item_urls), return_exceptions=True
+        )
+        details: List[tuple[str, str]] = []
+        for item_url, result in zip(item_urls, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to load details for %s: %s", item_url, result)
+                result = (f"Failed to load description: {result}", "")
+            details.append(result)
+        return details
+
+    async def _fetch_item_details(
+        self, item_url: str, summarizer: "DescriptionSummarizer"
+    ) -> tuple[str, str]:
+        """Fetch one item for fetch_item_details_many(); override to reroute."""
+        return await self.fetch_item_details(item_url, summarizer)
+
     async def close(self):  # pragma: no cover
         """Override if the scraper keeps any open connections / sessions."""
         return None
+
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all scrapers.
+
+    One pool means OLX -> Otodom delegation reuses TLS sessions, and HTTP/2
+    multiplexes concurrent detail fetches over a single connection per host.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            headers=BaseScraper.HEADERS,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            follow_redirects=True,
+            # Pool and retry settings live on the transport, which httpx uses
+            # as-is when given
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the HTTP client shared by all scrapers."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -2,24 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, time, timezone
 from typing import Dict, List, Set
+from zoneinfo import ZoneInfo
 
 import httpx
-import pytz
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from models import Item
 from tools.processing.description import DescriptionSummarizer
 from tools.utils.time_helpers import TimeUtils
 
-from .base import BaseScraper
+from .base import BaseScraper, get_shared_client
 from .types import ScraperType, get_proper_scraper, get_scraper_registry
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; evaluated by libxml2 for every listing card / detail page
+# Only today's cards ("Dzisiaj o HH:MM") are ever used, so libxml2 drops the
+# rest before any Python wrappers are built for them
+_CARD_XP = etree.XPath(
+    '//div[@data-testid="l-card"]'
+    '[.//p[@data-testid="location-date"][contains(., "Dzisiaj")]]'
+)
+_LOCATION_DATE_XP = etree.XPath('.//p[@data-testid="location-date"]')
+_TITLE_LINK_XP = etree.XPath('.//div[@data-cy="ad-card-title"]//a')
+_PRICE_XP = etree.XPath('.//p[@data-testid="ad-price"]')
+_THUMBNAIL_SRC_XP = etree.XPath('.//div[@data-testid="image-container"]//img/@src')
+_HIGHRES_IMG_XP = etree.XPath('//img[starts-with(@data-testid, "swiper-image")]')
+_DESCRIPTION_XP = etree.XPath('//div[@data-cy="ad_description"]')
+# Text nodes under an element, skipping comments, scripts and styles
+_TEXT_NODES_XP = etree.XPath(
+    ".//text()[not(parent::script or parent::style)]", smart_strings=False
+)
+
+# OLX serves UTF-8; parsing the raw body skips httpx's charset detection and
+# the str copy made by `response.text`
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# "<url> <width>w" candidates of an <img srcset>
+_SRCSET_RE = re.compile(r"([^\s,]+)\s+(\d+)w")
+
+_UTC = timezone.utc
+_PL_TZ = ZoneInfo("Europe/Warsaw")
+
+
+def _text(element: lxml_html.HtmlElement) -> str:
+    """Concatenate the stripped visible text nodes of *element*."""
+    return "".join(part.strip() for part in _TEXT_NODES_XP(element))
+
 
 class OLXScraper(BaseScraper):
     """OLX marketplace scraper.
@@ -37,12 +72,21 @@ class OLXScraper(BaseScraper):
         "X-Forwarded-For": "83.0.0.0",  # Polish IP range to get Polish timezone
         "CF-IPCountry": "PL",
     }
+    # Sent with every request on the shared client. Built once so httpx only
+    # copies it per request instead of re-encoding the dict each time.
+    _REQUEST_HEADERS = httpx.Headers(HEADERS)
+
+    # Maximum number of item detail pages requested at the same time, shared
+    # by all fetch_new_items() calls running concurrently on this scraper
+    DETAIL_FETCH_CONCURRENCY = 16
 
     def __init__(self) -> None:
-        self.client = httpx.AsyncClient(
-            headers=self.HEADERS, timeout=10, follow_redirects=True
-        )
+        # Shared with delegated scrapers; closed by the owner of the scrape
+        # loop via close_shared_client(), not by the scraper itself
+        self.client = get_shared_client()
         self._detail_fetchers: Dict[ScraperType, BaseScraper] = {}
+        self._closed = False
+        self._detail_semaphore = asyncio.Semaphore(self.DETAIL_FETCH_CONCURRENCY)
 
     async def fetch_new_items(
         self,
@@ -52,31 +96,32 @@ class OLXScraper(BaseScraper):
     ) -> List[Item]:
         logger.info("Fetching OLX items from %s", url)
 
-        response = await self.client.get(url)
+        response = await self.client.get(url, headers=self._REQUEST_HEADERS)
         logger.debug("OLX response status code: %s", response.status_code)
-        soup = BeautifulSoup(response.text, "html.parser")
-        divs = soup.find_all("div", attrs={"data-testid": "l-card"})
+        # lxml refuses an empty document; like a page without cards, an empty
+        # body simply yields no items
+        if not response.content.strip():
+            logger.warning("Empty OLX listing page from %s", url)
+            return []
+        tree = lxml_html.fromstring(response.content, parser=_HTML_PARSER)
+        cards = _CARD_XP(tree)
+
+        # One clock read per listing page, shared by every card
+        now_utc = datetime.now(_UTC)
 
         new_items: List[Item] = []
         skipped_count = 0
-        for div in divs:
-            location_date = div.find(
-                "p", attrs={"data-testid": "location-date"}
-            ).get_text(strip=True)
-            if "Dzisiaj" not in location_date:
-                logger.debug("Skipping non-today item: %s", location_date)
-                continue
-
+        for card in cards:
+            location_date = _text(_LOCATION_DATE_XP(card)[0])
             location, time_str = location_date.split("Dzisiaj o ")
             location = location.strip().rstrip("-").strip()
 
-            if not TimeUtils.within_last_minutes(time_str):
+            if not TimeUtils.within_last_minutes(time_str, now=now_utc):
                 logger.debug("Skipping old item at %s", time_str)
                 continue
 
-            title_div = div.find("div", attrs={"data-cy": "ad-card-title"})
-            a_tag = title_div.find("a")
-            item_url = a_tag["href"]
+            a_tag = _TITLE_LINK_XP(card)[0]
+            item_url = a_tag.get("href")
             if not item_url.startswith("http"):
                 item_url = "https://www.olx.pl" + item_url
 
@@ -84,19 +129,15 @@ class OLXScraper(BaseScraper):
                 skipped_count += 1
                 continue
 
-            title = a_tag.get_text(strip=True)
+            title = _text(a_tag)
 
-            price_div = div.find("p", attrs={"data-testid": "ad-price"})
-            price = price_div.get_text(strip=True) if price_div else "Brak ceny"
+            price_tags = _PRICE_XP(card)
+            price = _text(price_tags[0]) if price_tags else "Brak ceny"
 
-            image_div = div.find("div", attrs={"data-testid": "image-container"})
-            image_url = image_div.find("img")["src"] if image_div else ""
+            thumbnails = _THUMBNAIL_SRC_XP(card)
+            image_url = thumbnails[0] if thumbnails else ""
 
-            description, highres = await self._fetch_item_details(item_url, summarizer)
-            if highres:
-                image_url = highres
-
-            created_at, created_at_pretty = self._parse_times(time_str)
+            created_at, created_at_pretty = self._parse_times(time_str, now=now_utc)
 
             new_items.append(
                 Item(
@@ -107,10 +148,21 @@ class OLXScraper(BaseScraper):
                     created_at_pretty=created_at_pretty,
                     image_url=image_url,
                     item_url=item_url,
-                    description=description,
+                    description="",
                 )
             )
 
+        # Detail pages are independent requests; fetch them concurrently
+        details = await self.fetch_item_details_many(
+            [item.item_url for item in new_items],
+            summarizer,
+            semaphore=self._detail_semaphore,
+        )
+        for item, (description, highres) in zip(new_items, details):
+            item.description = description
+            if highres:
+                item.image_url = highres
+
         logger.info(
             "OLX scraper found %s new items, skipped %s existing",
             len(new_items),
@@ -127,12 +179,13 @@ class OLXScraper(BaseScraper):
         Returns:
             Instance of the requested scraper.
         """
-        if scraper_type not in self._detail_fetchers:
-            # Get registry and instantiate the appropriate scraper
-            registry = get_scraper_registry()
-            scraper_cls = registry[scraper_type]
-            self._detail_fetchers[scraper_type] = scraper_cls()
-        return self._detail_fetchers[scraper_type]
+        # Single lookup on the hot path. There is no await between the check and
+        # the store, so concurrent detail fetches cannot create two instances.
+        fetcher = self._detail_fetchers.get(scraper_type)
+        if fetcher is None:
+            scraper_cls = get_scraper_registry()[scraper_type]
+            fetcher = self._detail_fetchers[scraper_type] = scraper_cls()
+        return fetcher
 
     async def _fetch_item_details(
         self, item_url: str, summarizer: DescriptionSummarizer
@@ -163,73 +216,75 @@ class OLXScraper(BaseScraper):
             tuple[description, highres_image_url]
         """
         try:
-            response = await self.client.get(item_url)
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            raw_desc = self._extract_description(soup)
+            response = await self.client.get(item_url, headers=self._REQUEST_HEADERS)
+            # lxml refuses an empty document; store no description rather
+            # than its "Document is empty" error
+            if not response.content.strip():
+                return "", ""
+            tree = lxml_html.fromstring(response.content, parser=_HTML_PARSER)
+
+            raw_desc = self._extract_description(tree)
             # TODO: implement description summarization later
             # summary = await summarizer.summarize(raw_desc)
             # description = summary or raw_desc[:500]
             description = raw_desc[:500]
 
-            highres = self._extract_highres_image(soup)
+            highres = self._extract_highres_image(tree)
             return description, highres
         except Exception as exc:  # pragma: no cover
             logger.error("Failed to load details for %s: %s", item_url, exc)
             return f"Failed to load description: {exc}", ""
 
     @staticmethod
-    def _extract_highres_image(soup: BeautifulSoup) -> str:
+    def _extract_highres_image(tree: lxml_html.HtmlElement) -> str:
         """Return highest-quality image URL from item detail page if present."""
         try:
-            img_tag = soup.find(
-                "img", attrs={"data-testid": re.compile(r"^swiper-image")}
-            )
-            if not img_tag:
+            img_tags = _HIGHRES_IMG_XP(tree)
+            if not img_tags:
                 return ""
+            img_tag = img_tags[0]
             if img_tag.get("src"):
-                return img_tag["src"]
+                return img_tag.get("src")
             srcset = img_tag.get("srcset", "")
-            if srcset:
-                variants = [v.strip() for v in srcset.split(",")]
-                best_url = ""
-                best_w = 0
-                for variant in variants:
-                    try:
-                        url_part, size_part = variant.split(" ")
-                        width = int(size_part.rstrip("w"))
-                        if width > best_w:
-                            best_w = width
-                            best_url = url_part
-                    except ValueError:
-                        continue
-                return best_url
-            return ""
+            variants = _SRCSET_RE.findall(srcset)
+            if not variants:
+                return ""
+            best_url, _ = max(variants, key=lambda variant: int(variant[1]))
+            return best_url
         except Exception:
             return ""
 
     @staticmethod
-    def _extract_description(soup: BeautifulSoup) -> str:
-        description_tag = soup.find("div", attrs={"data-cy": "ad_description"})
-        return description_tag.get_text(strip=True) if description_tag else ""
+    def _extract_description(tree: lxml_html.HtmlElement) -> str:
+        description_tags = _DESCRIPTION_XP(tree)
+        return _text(description_tags[0]) if description_tags else ""
 
     @staticmethod
-    def _parse_times(time_str: str):
-        parsed_time = datetime.strptime(time_str, "%H:%M").time()
-        utc_tz = pytz.UTC
-        now_utc = datetime.now(utc_tz)
-        datetime_provided_utc = utc_tz.localize(
-            datetime.combine(now_utc.date(), parsed_time)
+    def _parse_times(time_str: str, now: datetime | None = None):
+        # OLX always renders "HH:MM"; slice it instead of running strptime
+        if len(time_str) == 5 and time_str[2] == ":":
+            parsed_time = time(int(time_str[:2]), int(time_str[3:]))
+        else:
+            parsed_time = datetime.strptime(time_str, "%H:%M").time()
+        now_utc = now if now is not None else datetime.now(_UTC)
+        datetime_provided_utc = datetime.combine(
+            now_utc.date(), parsed_time, tzinfo=_UTC
         )
-        poland_tz = pytz.timezone("Europe/Warsaw")
-        datetime_provided_pl = datetime_provided_utc.astimezone(poland_tz)
+        datetime_provided_pl = datetime_provided_utc.astimezone(_PL_TZ)
         datetime_naive_pl = datetime_provided_pl.replace(tzinfo=None)
         created_at_pretty = datetime_provided_pl.strftime("%d.%m.%Y - *%H:%M*")
         return datetime_naive_pl, created_at_pretty
 
     async def close(self):
-        await self.client.aclose()
-        # Close all delegated scrapers
-        for fetcher in self._detail_fetchers.values():
-            await fetcher.close()
+        if self._closed:
+            return
+        self._closed = True
+        # Close all delegated scrapers concurrently
+        results = await asyncio.gather(
+            *(fetcher.close() for fetcher in self._detail_fetchers.values()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error while closing OLX scraper resources: %s", result)
         await super().close()
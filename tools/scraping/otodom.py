@@ -5,25 +5,75 @@ from __future__ import annotations
 import html
 import json
 import logging
-from typing import List, Set, Tuple
+import time
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple, Union
 
-import httpx
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
 
 from models import Item
 from tools.processing.description import DescriptionSummarizer
 
-from .base import BaseScraper
+from .base import BaseScraper, get_shared_client
 
 logger = logging.getLogger(__name__)
 
+# Byte markers used to cut the __NEXT_DATA__ payload out of the raw page
+_NEXT_DATA_MARKER = b'id="__NEXT_DATA__"'
+_SCRIPT_END = b"</script>"
+
+# Fallback parse keeps only the __NEXT_DATA__ script, not the whole document
+_NEXT_DATA_STRAINER = SoupStrainer("script", id="__NEXT_DATA__")
+
+# Image size keys in order of preference
+_IMAGE_KEYS = ("large", "medium", "link", "url")
+
+# lxml refuses strings with XML-incompatible control characters (vertical
+# tabs from Word pastes and the like); they become spaces before parsing
+_XML_UNSAFE_CHARS = str.maketrans(
+    dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)], " ")
+)
+
+# Text nodes of the description HTML, skipping comments, scripts and styles
+_TEXT_NODES_XP = etree.XPath("//text()[not(parent::script or parent::style)]")
+
+
+def _html_to_text(fragment: str) -> str:
+    """Return the text nodes of an HTML *fragment*, one per line.
+
+    Whitespace runs inside a node (indentation, stray newlines, non-breaking
+    spaces) collapse to a single space; empty nodes are dropped.
+    """
+    if not fragment.strip():
+        return ""
+    root = lxml_html.fragment_fromstring(
+        fragment.translate(_XML_UNSAFE_CHARS), create_parent="div"
+    )
+    # str.split() with no argument splits on any whitespace run in C and
+    # drops the ends, so joining it back both strips and collapses
+    return "\n".join(
+        text
+        for text in (" ".join(node.split()) for node in _TEXT_NODES_XP(root))
+        if text
+    )
+
 
 class OtodomScraper(BaseScraper):
     """Scraper for Otodom.pl listings (property marketplace)."""
 
+    # Successful detail lookups are reused for this long (LRU-bounded), so
+    # retries and re-scrapes of the same listing skip the network entirely
+    DETAILS_CACHE_TTL_SECONDS = 300
+    DETAILS_CACHE_MAXSIZE = 2048
+
     def __init__(self) -> None:
-        self.client = httpx.AsyncClient(
-            headers=self.HEADERS, timeout=10, follow_redirects=True
+        self.client = get_shared_client()
+        # item URL -> (monotonic fetch time, (description, highres image))
+        self._details_cache: OrderedDict[str, tuple[float, Tuple[str, str]]] = (
+            OrderedDict()
         )
 
     async def fetch_new_items(
@@ -40,62 +90,126 @@ class OtodomScraper(BaseScraper):
         self, item_url: str, summarizer: DescriptionSummarizer
     ) -> Tuple[str, str]:
         """Fetch description and image URL from a single Otodom listing."""
+        now = time.monotonic()
+        cached = self._details_cache.get(item_url)
+        if cached is not None and now - cached[0] < self.DETAILS_CACHE_TTL_SECONDS:
+            self._details_cache.move_to_end(item_url)
+            return cached[1]
+
         try:
             response = await self.client.get(item_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            raw_desc, highres = self._extract_from_next_data(soup)
+            payload = self._slice_next_data(response.content)
+            if payload is not None:
+                raw_desc, highres = self._parse_next_data(payload)
+            else:
+                soup = BeautifulSoup(
+                    response.content, "lxml", parse_only=_NEXT_DATA_STRAINER
+                )
+                raw_desc, highres = self._extract_from_next_data(soup)
 
             # TODO: implement summarizer
             # description = summarizer.summarize(raw_desc) if raw_desc else "No description available"
 
+            self._remember_details(item_url, now, (raw_desc, highres))
             return raw_desc, highres
 
         except Exception as exc:
             logger.exception("Failed to load Otodom details for %s: %s", item_url, exc)
             return f"Failed to load description: {exc}", ""
 
+    def _remember_details(
+        self, item_url: str, fetched_at: float, details: Tuple[str, str]
+    ) -> None:
+        """Cache *details* for *item_url*, evicting the least recently used."""
+        self._details_cache[item_url] = (fetched_at, details)
+        self._details_cache.move_to_end(item_url)
+        if len(self._details_cache) > self.DETAILS_CACHE_MAXSIZE:
+            self._details_cache.popitem(last=False)
+
     # ---- Extraction helpers ----
 
     @staticmethod
-    def _extract_from_next_data(soup: BeautifulSoup) -> Tuple[str, str]:
+    def _slice_next_data(body: bytes) -> Optional[bytes]:
+        """Return the raw __NEXT_DATA__ JSON from *body* without parsing the HTML.
+
+        Returns ``None`` when the script tag cannot be located so callers can
+        fall back to a full parse.
+        """
+        marker = body.find(_NEXT_DATA_MARKER)
+        if marker == -1:
+            return None
+        start = body.find(b">", marker)
+        if start == -1:
+            return None
+        end = body.find(_SCRIPT_END, start)
+        if end == -1:
+            return None
+        return body[start + 1 : end]
+
+    @classmethod
+    def _extract_from_next_data(cls, soup: BeautifulSoup) -> Tuple[str, str]:
         """Extract description and image from the __NEXT_DATA__ JSON."""
         script_tag = soup.find("script", id="__NEXT_DATA__")
         if not script_tag or not script_tag.string:
             return "", ""
 
-        try:
-            data = json.loads(script_tag.string)
-        except json.JSONDecodeError:
-            logger.warning("Invalid JSON in __NEXT_DATA__")
+        # orjson only accepts exact str/bytes, not bs4's NavigableString
+        return cls._parse_next_data(str(script_tag.string))
+
+    @staticmethod
+    def _parse_next_data(payload: Union[str, bytes]) -> Tuple[str, str]:
+        """Decode a __NEXT_DATA__ payload into description and image URL."""
+        if not payload.strip():
             return "", ""
 
-        # Traverse to the ad object
-        ad = data.get("props", {}).get("pageProps", {}).get("ad", {})
+        try:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes ("\ud83d" from a
+            # description cut mid-emoji) that the stdlib decoder accepts
+            try:
+                data = json.loads(payload)
+            except ValueError:
+                logger.warning("Invalid JSON in __NEXT_DATA__")
+                return "", ""
+
+        # Traverse to the ad object; pages without one are rare, so pay for
+        # the exception there rather than for default dicts on every page
+        try:
+            ad = data["props"]["pageProps"]["ad"]
+        except (KeyError, TypeError):
+            return "", ""
+        if not isinstance(ad, dict):
+            return "", ""
 
         # --- Description ---
         description_html = ad.get("description", "")
-        description_html = html.unescape(description_html)
-        description_text = BeautifulSoup(description_html, "html.parser").get_text(
-            separator="\n", strip=True
-        )
+        # Otodom sometimes sends the markup itself entity-escaped
+        # ("&lt;p&gt;..."), so decode it before parsing. Without an "&"
+        # there is nothing to decode.
+        if "&" in description_html:
+            description_html = html.unescape(description_html)
+        description_text = _html_to_text(description_html)
 
         # --- High-res Image ---
         highres = ""
         images = ad.get("images") or ad.get("photos") or []
-        if isinstance(images, list) and images:
-            # Try "large" first, fallback to first available
-            for img in images:
-                for key in ("large", "medium", "link", "url"):
-                    if key in img and isinstance(img[key], str):
-                        highres = img[key]
-                        break
-                if highres:
-                    break
+        if isinstance(images, list):
+            # First string URL, walking images in order and sizes by preference
+            highres = next(
+                (
+                    url
+                    for img in images
+                    if isinstance(img, dict)
+                    for key in _IMAGE_KEYS
+                    if isinstance(url := img.get(key), str) and url
+                ),
+                "",
+            )
 
         return description_text, highres
 
     async def close(self):
-        await self.client.aclose()
+        # The HTTP client is shared, see close_shared_client()
         await super().close()
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict, Type
-from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from .base import BaseScraper
@@ -26,20 +26,45 @@ def get_proper_scraper(url: str) -> ScraperType:
     Returns:
         ScraperType enum value indicating which scraper should handle this URL.
     """
-    domain = urlparse(url).netloc.lower()
+    return _scraper_for_domain(_netloc(url))
 
-    if "otodom" in domain:
-        return ScraperType.OTODOM
-    elif "olx" in domain:
-        return ScraperType.OLX
-    else:
-        # Default fallback to OLX
-        return ScraperType.OLX
 
+# Checked in order; the first marker found in the host wins
+_DOMAIN_SCRAPERS = (
+    ("otodom", ScraperType.OTODOM),
+    ("olx", ScraperType.OLX),
+)
 
+
+def _netloc(url: str) -> str:
+    """Return the authority part of *url* like ``urlparse(url).netloc``.
+
+    Slices the string directly instead of building a ParseResult.
+    """
+    parts = url.split("/", 3)
+    if len(parts) < 3 or parts[1] or (parts[0] and not parts[0].endswith(":")):
+        return ""
+    return parts[2].partition("?")[0].partition("#")[0]
+
+
+@lru_cache(maxsize=4096)
+def _scraper_for_domain(domain: str) -> ScraperType:
+    """Map a host to its scraper type (memoized per host)."""
+    domain = domain.lower()
+    for marker, scraper_type in _DOMAIN_SCRAPERS:
+        if marker in domain:
+            return scraper_type
+    # Default fallback to OLX
+    return ScraperType.OLX
+
+
+@lru_cache(maxsize=1)
 def get_scraper_registry() -> Dict[ScraperType, Type["BaseScraper"]]:
     """Get the scraper registry with lazy imports to avoid circular dependencies.
 
+    The registry is built on the first call and the same dict is returned
+    afterwards; treat it as read-only.
+
     Returns:
         Dictionary mapping ScraperType to scraper implementation classes.
     """
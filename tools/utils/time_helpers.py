@@ -7,11 +7,9 @@ Currently contains TimeUtils.within_last_minutes which is a refactor of
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-import pytz
-
-from core.config import settings
+from core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +18,9 @@ class TimeUtils:
     """Collection of static helpers for dealing with OLX time strings."""
 
     @staticmethod
-    def within_last_minutes(time_str: str, n: int | None = None) -> bool:
+    def within_last_minutes(
+        time_str: str, n: int | None = None, now: datetime | None = None
+    ) -> bool:
         """Return True if the given HH:MM string is within *n* minutes from now.
 
         OLX uses UTC time for the `Dzisiaj o HH:MM` indicator. This helper
@@ -29,18 +29,19 @@ class TimeUtils:
 
         Args:
             time_str: A time formatted as 'HH:MM'.
-            n: Number of minutes. Defaults to settings.DEFAULT_LAST_MINUTES_GETTING.
+            n: Number of minutes. Defaults to DEFAULT_LAST_MINUTES_GETTING from settings.
+            now: Timezone-aware current UTC time. Pass it when checking many
+                strings in a row to avoid a clock read per call.
         """
         if n is None:
-            n = settings.DEFAULT_LAST_MINUTES_GETTING
+            n = get_settings().DEFAULT_LAST_MINUTES_GETTING
 
         time_format = "%H:%M"
         try:
             parsed_time = datetime.strptime(time_str, time_format).time()
-            utc_tz = pytz.UTC
-            now_utc = datetime.now(utc_tz)
-            time_provided_utc = utc_tz.localize(
-                datetime.combine(now_utc.date(), parsed_time)
+            now_utc = now if now is not None else datetime.now(timezone.utc)
+            time_provided_utc = datetime.combine(
+                now_utc.date(), parsed_time, tzinfo=timezone.utc
             )
             n_minutes_ago_utc = now_utc - timedelta(minutes=n)
             return time_provided_utc >= n_minutes_ago_utc